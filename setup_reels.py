@@ -28,12 +28,18 @@ USAGE:
 """
 
 import argparse
+import concurrent.futures
 import os
 import platform
 import shutil
 import subprocess
 import sys
+import time
+from email.utils import formatdate
+from functools import lru_cache
 from pathlib import Path
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 
 
 class Colors:
@@ -45,46 +51,75 @@ class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
+    # Prefixes pre-encoded once at import so status lines skip per-call
+    # f-string construction and stdout's text-mode codec
+    STEP_PFX = f"\n{BLUE}{BOLD}▶ ".encode()
+    SUCC_PFX = f"{GREEN}✅ ".encode()
+    WARN_PFX = f"{YELLOW}⚠️  ".encode()
+    ERR_PFX = f"{RED}❌ ".encode()
+    RESET_NL = f"{RESET}\n".encode()
+
+
+def _write_line(prefix, msg):
+    """Write a pre-encoded status line straight to the byte stream"""
+    # Flush the text layer first so lines stay ordered with plain print()
+    sys.stdout.flush()
+    sys.stdout.buffer.write(prefix + msg.encode("utf-8", "replace") + Colors.RESET_NL)
+    sys.stdout.buffer.flush()
+
 
 def print_step(msg):
     """Print a step message with formatting"""
-    print(f"\n{Colors.BLUE}{Colors.BOLD}▶ {msg}{Colors.RESET}")
+    _write_line(Colors.STEP_PFX, msg)
 
 
 def print_success(msg):
     """Print a success message"""
-    print(f"{Colors.GREEN}✅ {msg}{Colors.RESET}")
+    _write_line(Colors.SUCC_PFX, msg)
 
 
 def print_warning(msg):
     """Print a warning message"""
-    print(f"{Colors.YELLOW}⚠️  {msg}{Colors.RESET}")
+    _write_line(Colors.WARN_PFX, msg)
 
 
 def print_error(msg):
     """Print an error message"""
-    print(f"{Colors.RED}❌ {msg}{Colors.RESET}")
+    _write_line(Colors.ERR_PFX, msg)
 
 
-def run(cmd, *, cwd=None, env=None, check=True, shell=False, capture_output=False):
-    """Run a command and print it. Raises on failure if check=True."""
+def run(cmd, *, cwd=None, env=None, check=True, shell=False, capture_output=False, quiet=False):
+    """Run a command and print it. Raises on failure if check=True.
+
+    Use quiet=True when only the exit code matters: output goes to
+    /dev/null instead of being buffered and decoded in memory.
+    """
     if isinstance(cmd, list):
         printable = " ".join(str(c) for c in cmd)
     else:
         printable = cmd
-    
+
     print_step(printable)
-    
+
     try:
         if capture_output:
             result = subprocess.run(
-                cmd, 
-                cwd=cwd, 
-                env=env, 
-                shell=shell, 
-                capture_output=True, 
+                cmd,
+                cwd=cwd,
+                env=env,
+                shell=shell,
+                capture_output=True,
                 text=True
             )
+        elif quiet:
+            result = subprocess.run(
+                cmd,
+                cwd=cwd,
+                env=env,
+                shell=shell,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
         else:
             result = subprocess.run(cmd, cwd=cwd, env=env, shell=shell)
         
@@ -98,22 +133,80 @@ def run(cmd, *, cwd=None, env=None, check=True, shell=False, capture_output=Fals
         return None
 
 
+def fetch(url, dest):
+    """Download a URL to a local file in-process (no curl/shell forks)"""
+    print_step(f"Downloading {url}")
+    data = urlopen(url, timeout=30).read()
+    Path(dest).write_bytes(data)
+    return dest
+
+
+def fetch_cached(url, dest):
+    """Download a URL to dest, reusing the cached copy when unchanged.
+
+    Sends If-Modified-Since based on the cached file's mtime; a 304
+    response skips the transfer entirely on repeated runs.
+    """
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+
+    headers = {}
+    if dest.exists():
+        headers["If-Modified-Since"] = formatdate(dest.stat().st_mtime, usegmt=True)
+
+    print_step(f"Downloading {url}")
+    try:
+        data = urlopen(Request(url, headers=headers), timeout=30).read()
+    except HTTPError as e:
+        if e.code == 304:
+            print_success(f"Cached copy is current: {dest}")
+            return dest
+        raise
+    dest.write_bytes(data)
+    return dest
+
+
+@lru_cache(maxsize=None)
 def which(name: str):
-    """Check if a command exists in PATH"""
+    """Check if a command exists in PATH (cached per session)"""
     return shutil.which(name)
 
 
+def invalidate_which():
+    """Clear the which() cache after an install step modifies PATH"""
+    which.cache_clear()
+
+
+def report_node_versions(env):
+    """Print node and npm versions with a single node startup"""
+    out = subprocess.check_output(
+        ["node", "-p",
+         "process.version + ' (npm ' + "
+         "require('child_process').execSync('npm -v').toString().trim() + ')'"],
+        env=env,
+        text=True
+    ).strip()
+    print_success(f"Node.js {out}")
+
+
+# Cached OS name; the platform never changes mid-run, so detect once
+_OS_TYPE = None
+
+
 def get_os():
-    """Detect the operating system"""
-    system = platform.system().lower()
-    if system == "darwin":
-        return "macos"
-    elif system == "linux":
-        return "linux"
-    elif system == "windows":
-        return "windows"
-    else:
-        raise RuntimeError(f"Unsupported OS: {system}")
+    """Detect the operating system (cached after the first call)"""
+    global _OS_TYPE
+    if _OS_TYPE is None:
+        system = platform.system().lower()
+        if system == "darwin":
+            _OS_TYPE = "macos"
+        elif system == "linux":
+            _OS_TYPE = "linux"
+        elif system == "windows":
+            _OS_TYPE = "windows"
+        else:
+            raise RuntimeError(f"Unsupported OS: {system}")
+    return _OS_TYPE
 
 
 def is_admin():
@@ -153,45 +246,57 @@ def setup_chocolatey_windows(env):
     )
     
     run(["powershell", "-Command", install_cmd], env=env, shell=False)
+    invalidate_which()
     print_success("Chocolatey installed")
-    
+
     return env
 
 
-def install_package_windows(env, package):
-    """Install a package using Chocolatey on Windows"""
-    if which(package):
-        print_success(f"{package} already installed")
-        return
-    
-    print_step(f"Installing {package} via Chocolatey...")
-    run(["choco", "install", package, "-y"], env=env)
-    print_success(f"{package} installed")
+def install_packages_windows(env, packages):
+    """Install packages in a single choco invocation.
 
+    Chocolatey enforces a single-instance global lock, so installs are
+    batched into one command rather than run concurrently; output
+    streams straight to the terminal so failures keep their diagnostics.
+    """
+    print_step(f"Installing via Chocolatey: {', '.join(packages)}")
+    run(["choco", "install", *packages, "-y"], env=env)
+    print_success(f"Installed: {', '.join(packages)}")
 
-def setup_node_windows(env):
-    """Install Node.js on Windows"""
-    if which("node"):
-        print_success("Node.js already installed")
-        run(["node", "-v"], env=env)
-        run(["npm", "-v"], env=env)
-        return env
-    
-    print_step("Installing Node.js...")
-    install_package_windows(env, "nodejs-lts")
-    
-    # Refresh PATH
-    refresh_env_windows()
-    
-    run(["node", "-v"], env=env)
-    run(["npm", "-v"], env=env)
-    return env
 
+def refresh_env_windows(env):
+    """Refresh PATH on Windows by reading the registry directly.
 
-def refresh_env_windows():
-    """Refresh environment variables on Windows"""
+    Avoids spawning refreshenv (a PowerShell cold start) after every
+    Chocolatey install; machine and user PATH are merged in-process.
+    """
     print_step("Refreshing environment variables...")
-    run(["refreshenv"], shell=True, check=False)
+    try:
+        import winreg
+    except ImportError:
+        return
+
+    paths = []
+    for root, subkey in (
+        (winreg.HKEY_LOCAL_MACHINE,
+         r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment"),
+        (winreg.HKEY_CURRENT_USER, "Environment"),
+    ):
+        try:
+            with winreg.OpenKey(root, subkey) as key:
+                value, value_type = winreg.QueryValueEx(key, "Path")
+        except OSError:
+            continue
+        # The machine Path is REG_EXPAND_SZ and comes back unexpanded;
+        # literal %SystemRoot%-style entries would break lookups
+        if value and value_type == winreg.REG_EXPAND_SZ:
+            value = winreg.ExpandEnvironmentStrings(value)
+        if value:
+            paths.append(value)
+
+    if paths:
+        env["PATH"] = os.environ["PATH"] = os.pathsep.join(paths)
+    invalidate_which()
 
 
 def setup_windows(env):
@@ -202,14 +307,20 @@ def setup_windows(env):
     
     # Install Chocolatey
     env = setup_chocolatey_windows(env)
-    
-    # Install packages
-    install_package_windows(env, "git")
-    install_package_windows(env, "ffmpeg")
-    
-    # Node.js
-    env = setup_node_windows(env)
-    
+
+    # Install packages in one choco transaction
+    pkgs = [p for p in ("git", "ffmpeg") if not which(p)]
+    if not which("node"):
+        pkgs.append("nodejs-lts")
+
+    if pkgs:
+        install_packages_windows(env, pkgs)
+        refresh_env_windows(env)
+    else:
+        print_success("git, ffmpeg and Node.js already installed")
+
+    report_node_versions(env)
+
     return env
 
 
@@ -227,47 +338,76 @@ def detect_brew_bin():
 
 def setup_homebrew_macos(env):
     """Install Homebrew on macOS"""
+    # Let brew's DownloadQueue fetch bottles in parallel, and keep
+    # installs from re-triggering an auto-update.
+    env["HOMEBREW_DOWNLOAD_CONCURRENCY"] = "16"
+    env["HOMEBREW_NO_AUTO_UPDATE"] = "1"
+
     brew = detect_brew_bin()
     if brew:
         print_success("Homebrew found")
         return env
     
     print_warning("Homebrew not found. Installing...")
-    install_script = (
-        '/bin/bash -c "$(curl -fsSL '
-        'https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"'
+    script = fetch(
+        "https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh",
+        "/tmp/homebrew_install.sh"
     )
-    run(install_script, shell=True, env=env)
+    run(["/bin/bash", script], env=env)
     
     brew = detect_brew_bin()
     if not brew:
         raise RuntimeError("Homebrew installation failed")
     
     brew_dir = str(Path(brew).parent)
-    env["PATH"] = brew_dir + os.pathsep + env.get("PATH", "")
+    # Mirror into os.environ so which() (shutil.which) sees the new dir
+    env["PATH"] = os.environ["PATH"] = brew_dir + os.pathsep + env.get("PATH", "")
+    invalidate_which()
     print_success(f"Homebrew installed at {brew_dir}")
     
     return env
 
 
-def brew_install(env, formula):
-    """Install a package via Homebrew"""
-    rc = run(["brew", "list", "--versions", formula], env=env, check=False, capture_output=True)
-    if rc and rc.returncode == 0:
-        print_success(f"{formula} already installed")
-        return
-    
-    print_step(f"Installing {formula}...")
-    run(["brew", "install", formula], env=env)
-    print_success(f"{formula} installed")
+# Cache of installed formulae, populated once per session. Every brew
+# invocation pays a multi-second Ruby startup, so per-formula
+# `brew list --versions` probes are avoided.
+_BREW_INSTALLED = None
+
+
+def brewed(env):
+    """Return the set of installed formulae, enumerating brew once"""
+    global _BREW_INSTALLED
+    if _BREW_INSTALLED is None:
+        result = run(["brew", "list", "--formula", "-1"], env=env, check=False, capture_output=True)
+        if result and result.returncode == 0:
+            _BREW_INSTALLED = set(result.stdout.splitlines())
+        else:
+            _BREW_INSTALLED = set()
+    return _BREW_INSTALLED
+
+
+def should_brew_update(env, max_age_hours=24):
+    """Skip `brew update` when the taps were fetched recently.
+
+    `brew update` pulls multiple git repos and is often the slowest
+    step; the FETCH_HEAD mtime tells us when the last fetch happened.
+    """
+    try:
+        repo = subprocess.check_output(["brew", "--repo"], env=env, text=True).strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return True
+
+    fetch_head = Path(repo) / ".git" / "FETCH_HEAD"
+    if not fetch_head.exists():
+        return True
+    return (time.time() - fetch_head.stat().st_mtime) > max_age_hours * 3600
 
 
 def setup_node_macos(env):
     """Install Node.js on macOS"""
     if which("node"):
         print_success("Node.js already installed")
-        run(["node", "-v"], env=env)
-        run(["npm", "-v"], env=env)
+        report_node_versions(env)
         return env
     
     print_step("Installing Node.js LTS...")
@@ -281,11 +421,12 @@ def setup_node_macos(env):
     for formula in ("node@22", "node@20"):
         binpath = Path(prefix) / "opt" / formula / "bin"
         if binpath.exists():
-            env["PATH"] = str(binpath) + os.pathsep + env.get("PATH", "")
+            # Mirror into os.environ so which() sees the keg-only bin dir
+            env["PATH"] = os.environ["PATH"] = str(binpath) + os.pathsep + env.get("PATH", "")
             break
-    
-    run(["node", "-v"], env=env)
-    run(["npm", "-v"], env=env)
+    invalidate_which()
+
+    report_node_versions(env)
     return env
 
 
@@ -298,11 +439,18 @@ def setup_macos(env):
     # Install Homebrew
     env = setup_homebrew_macos(env)
     
-    # Update and install packages
-    run(["brew", "update"], env=env)
-    brew_install(env, "git")
-    brew_install(env, "ffmpeg")
-    brew_install(env, "mpv")
+    # Update and install packages in one brew command so brew's internal
+    # download queue parallelizes bottle fetch+extract
+    if should_brew_update(env):
+        run(["brew", "update"], env=env)
+    else:
+        print_success("Homebrew updated recently, skipping brew update")
+    missing = [f for f in ("git", "ffmpeg", "mpv") if f not in brewed(env)]
+    if missing:
+        run(["brew", "install", *missing], env=env)
+        brewed(env).update(missing)
+    else:
+        print_success("git, ffmpeg and mpv already installed")
     
     # Node.js
     env = setup_node_macos(env)
@@ -314,74 +462,147 @@ def setup_macos(env):
 # LINUX SETUP
 # ============================================================================
 
+# apt-get rather than the human-facing apt wrapper: no pty-driven
+# progress bar, deterministic output, and a few download retries.
+# sudo's default env_reset strips DEBIAN_FRONTEND, so dpkg's
+# noninteractive conffile behavior is forced via options instead
+APT_GET = [
+    "sudo", "apt-get",
+    "-o", "Dpkg::Use-Pty=0",
+    "-o", "Acquire::Retries=3",
+    "-o", "Dpkg::Options::=--force-confdef",
+    "-o", "Dpkg::Options::=--force-confold",
+]
+
+# Chromium plus the shared libraries Puppeteer's bundled browser needs,
+# and fonts for rendered text. Installed only with --with-puppeteer.
+CHROMIUM_PACKAGES = [
+    "chromium-browser",
+    "fonts-liberation",
+    "libasound2",
+    "libatk-bridge2.0-0",
+    "libatk1.0-0",
+    "libcups2",
+    "libdrm2",
+    "libgbm1",
+    "libgtk-3-0",
+    "libnss3",
+    "libpangocairo-1.0-0",
+    "libxcomposite1",
+    "libxdamage1",
+    "libxfixes3",
+    "libxkbcommon0",
+    "libxrandr2",
+]
+
+# Cache of installed packages, populated once per session so package
+# checks don't fork dpkg and re-parse /var/lib/dpkg/status each time.
+_INSTALLED_PKGS = None
+
+
+def installed_packages_linux():
+    """Return the set of installed packages, enumerating dpkg once"""
+    global _INSTALLED_PKGS
+    if _INSTALLED_PKGS is None:
+        result = run(
+            ["dpkg-query", "-W", "-f=${Package}\n"],
+            check=False,
+            capture_output=True
+        )
+        if result and result.returncode == 0:
+            _INSTALLED_PKGS = set(result.stdout.splitlines())
+        else:
+            _INSTALLED_PKGS = set()
+    return _INSTALLED_PKGS
+
+
+def invalidate_package_cache_linux():
+    """Drop the installed-package cache after apt modifies the system"""
+    global _INSTALLED_PKGS
+    _INSTALLED_PKGS = None
+
+
 def update_apt():
     """Update apt package lists"""
     print_step("Updating package lists...")
-    run(["sudo", "apt", "update"], check=True)
+    run([*APT_GET, "update", "-qq"], check=True)
 
 
-def install_package_linux(package):
-    """Install a package using apt"""
-    # Check if installed
-    result = run(
-        ["dpkg", "-l", package], 
-        check=False, 
-        capture_output=True
-    )
-    
-    if result and result.returncode == 0 and package in result.stdout:
-        print_success(f"{package} already installed")
-        return
-    
-    print_step(f"Installing {package}...")
-    run(["sudo", "apt", "install", "-y", package])
-    print_success(f"{package} installed")
+def node_major_version(env):
+    """Return node's major version, or 0 when node is missing/broken"""
+    try:
+        out = subprocess.check_output(["node", "-v"], env=env, text=True).strip()
+        return int(out.lstrip("v").split(".")[0])
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+        return 0
 
 
 def setup_node_linux(env):
     """Install Node.js on Linux using NodeSource"""
-    if which("node"):
+    if which("node") and node_major_version(env) >= 22:
         print_success("Node.js already installed")
-        run(["node", "-v"], env=env)
-        run(["npm", "-v"], env=env)
+        report_node_versions(env)
         return env
-    
+
     print_step("Installing Node.js LTS via NodeSource...")
-    
-    # Install Node.js 22.x LTS
-    run([
-        "curl", "-fsSL", 
+
+    # Install Node.js 22.x LTS; the setup script is cached across runs
+    script = fetch_cached(
         "https://deb.nodesource.com/setup_22.x",
-        "-o", "/tmp/nodesource_setup.sh"
-    ], env=env)
-    
-    run(["sudo", "bash", "/tmp/nodesource_setup.sh"], env=env)
-    install_package_linux("nodejs")
-    
-    run(["node", "-v"], env=env)
-    run(["npm", "-v"], env=env)
-    
+        Path.home() / ".cache" / "wilt-reels" / "nodesource_setup.sh"
+    )
+    run(["sudo", "-E", "bash", str(script)], env=env)
+    # Install unconditionally: apt upgrades an already-installed nodejs
+    # to the NodeSource version, which a cache check would skip
+    run([*APT_GET, "install", "-y", "nodejs"])
+    invalidate_package_cache_linux()
+    invalidate_which()
+
+    report_node_versions(env)
+
     return env
 
 
-def setup_linux(env):
+def batch_install_linux(packages):
+    """Install several packages in a single apt transaction.
+
+    One apt call resolves dependencies and runs dpkg triggers once,
+    instead of paying that overhead per package.
+    """
+    missing = [p for p in packages if p not in installed_packages_linux()]
+    if not missing:
+        print_success(f"Already installed: {', '.join(packages)}")
+        return
+
+    print_step(f"Installing: {', '.join(missing)}")
+    run([*APT_GET, "install", "-y", "--no-install-recommends", *missing])
+    invalidate_package_cache_linux()
+    print_success(f"Installed: {', '.join(missing)}")
+
+
+def setup_linux(env, with_puppeteer=False):
     """Complete Linux setup"""
     print("\n" + "="*60)
     print("LINUX (UBUNTU/DEBIAN) SETUP")
     print("="*60)
-    
+
+    # Reaches the sudo -E NodeSource call; plain sudo apt-get strips it,
+    # which the Dpkg::Options in APT_GET cover
+    env["DEBIAN_FRONTEND"] = os.environ["DEBIAN_FRONTEND"] = "noninteractive"
+
     # Update package lists
     update_apt()
-    
-    # Install packages
-    install_package_linux("git")
-    install_package_linux("curl")
-    install_package_linux("ffmpeg")
-    install_package_linux("mpv")
-    
+
+    # Install packages in one apt transaction; the puppeteer/chromium
+    # stack joins the same batch rather than running its own installs
+    packages = ["git", "curl", "ffmpeg", "mpv"]
+    if with_puppeteer:
+        packages += CHROMIUM_PACKAGES
+    batch_install_linux(packages)
+
     # Node.js
     env = setup_node_linux(env)
-    
+
     return env
 
 
@@ -389,34 +610,42 @@ def setup_linux(env):
 # COMMON SETUP (ALL PLATFORMS)
 # ============================================================================
 
-def setup_pnpm(env):
-    """Install pnpm package manager"""
+def setup_pnpm(env, legacy_pnpm=False):
+    """Install pnpm package manager via corepack"""
     if which("pnpm"):
         print_success("pnpm already installed")
         run(["pnpm", "-v"], env=env)
         return env
-    
-    print_step("Installing pnpm...")
-    
-    # Try corepack first (modern Node.js)
+
+    # Corepack ships with Node 16.9+, so it is the fast path: no npm
+    # cold start needed to get pnpm
     if which("corepack"):
         print_step("Enabling pnpm via corepack...")
+        # Output streams: a failure here (e.g. EACCES on the symlink)
+        # is the diagnostic for the fail-fast below
         run(["corepack", "enable"], env=env, check=False)
         run(["corepack", "prepare", "pnpm@latest", "--activate"], env=env, check=False)
-    
-    # Check if pnpm is now available
+        invalidate_which()
+
     if which("pnpm"):
         print_success("pnpm enabled via corepack")
         run(["pnpm", "-v"], env=env)
         return env
-    
-    # Fallback to npm global install
+
+    if not legacy_pnpm:
+        raise RuntimeError(
+            "corepack could not provide pnpm (it ships with Node 16.9+); "
+            "re-run with --legacy-pnpm to fall back to 'npm install -g pnpm'"
+        )
+
+    # Legacy fallback, kept behind --legacy-pnpm: costs a full npm start
     print_step("Installing pnpm globally via npm...")
     run(["npm", "install", "-g", "pnpm"], env=env)
-    
+    invalidate_which()
+
     run(["pnpm", "-v"], env=env)
     print_success("pnpm installed")
-    
+
     return env
 
 
@@ -430,7 +659,12 @@ def clone_or_validate_repo(env, repo_url, project_dir):
     
     print_step(f"Cloning repository to: {project_dir}")
     project_dir.parent.mkdir(parents=True, exist_ok=True)
-    run(["git", "clone", repo_url, str(project_dir)], env=env)
+    # Shallow partial clone: the setup only needs the current tree,
+    # not the full history or old blobs
+    run([
+        "git", "clone", "--depth=1", "--single-branch", "--filter=blob:none",
+        repo_url, str(project_dir)
+    ], env=env)
     
     if not package_json.exists():
         raise RuntimeError(f"Clone succeeded but package.json not found in {project_dir}")
@@ -438,26 +672,77 @@ def clone_or_validate_repo(env, repo_url, project_dir):
     print_success("Repository cloned successfully")
 
 
+def prepare_project(env, repo_url, project_dir, legacy_pnpm=False):
+    """Set up pnpm and clone the repo concurrently.
+
+    Both are independent network/disk work, and `pnpm install` is the
+    only consumer of both, so this stage costs max() instead of sum()
+    of the two latencies.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        pnpm_future = pool.submit(setup_pnpm, env, legacy_pnpm)
+        clone_future = pool.submit(clone_or_validate_repo, env, repo_url, project_dir)
+        env = pnpm_future.result()
+        clone_future.result()
+    return env
+
+
 def install_dependencies(env, project_dir):
     """Install project dependencies via pnpm"""
     print("\n" + "="*60)
     print("INSTALLING PROJECT DEPENDENCIES")
     print("="*60)
-    
-    run(["pnpm", "install"], env=env, cwd=str(project_dir))
+
+    # Skip fund/audit registry round-trips; they only add seconds
+    env["npm_config_fund"] = "false"
+    env["npm_config_audit"] = "false"
+
+    # Frozen lockfile skips re-resolution, prefer-offline reuses the
+    # content-addressable store instead of hitting the registry
+    run(
+        ["pnpm", "install", "--frozen-lockfile", "--prefer-offline", "--reporter=append-only"],
+        env=env,
+        cwd=str(project_dir)
+    )
     print_success("Dependencies installed")
 
 
-def render_video(env, project_dir):
-    """Render the video using pnpm"""
+def install_and_render(env, project_dir):
+    """Install dependencies and render the video.
+
+    On POSIX the interpreter execs into one shell child that chains the
+    install and the render, freeing Python's RSS for the duration of the
+    multi-minute render; Windows has no true exec, so both steps run as
+    child processes there.
+    """
     print("\n" + "="*60)
-    print("RENDERING VIDEO")
+    print("INSTALLING DEPENDENCIES + RENDERING VIDEO")
     print("="*60)
-    
-    run(["pnpm", "render"], env=env, cwd=str(project_dir))
-    
+
+    env["npm_config_fund"] = "false"
+    env["npm_config_audit"] = "false"
+
+    install_cmd = [
+        "pnpm", "install", "--frozen-lockfile", "--prefer-offline", "--reporter=append-only"
+    ]
+
+    if get_os() == "windows":
+        run(install_cmd, env=env, cwd=str(project_dir))
+        run(["pnpm", "render"], env=env, cwd=str(project_dir))
+        report_render_output(project_dir)
+        return
+
+    shell_cmd = " ".join(install_cmd) + " && pnpm render"
+    print_step(shell_cmd)
+    os.chdir(project_dir)
+    sys.stdout.flush()
+    os.execvpe("/bin/sh", ["/bin/sh", "-c", shell_cmd], env)
+
+
+def report_render_output(project_dir):
+    """Check for the rendered file and print how to play it"""
     out_mp4 = project_dir / "out" / "video.mp4"
-    
+
     if out_mp4.exists():
         print_success("Video rendered successfully!")
         print(f"\n📹 Output: {out_mp4}")
@@ -531,10 +816,20 @@ Examples:
         help=f"Project directory (default: {default_dir})"
     )
     parser.add_argument(
-        "--no-render", 
-        action="store_true", 
+        "--no-render",
+        action="store_true",
         help="Skip video rendering (setup only)"
     )
+    parser.add_argument(
+        "--with-puppeteer",
+        action="store_true",
+        help="Also install Chromium and Puppeteer dependencies (Linux only)"
+    )
+    parser.add_argument(
+        "--legacy-pnpm",
+        action="store_true",
+        help="Fall back to 'npm install -g pnpm' if corepack can't provide pnpm"
+    )
     
     args = parser.parse_args()
     
@@ -558,30 +853,35 @@ Examples:
     elif os_type == "macos":
         env = setup_macos(env)
     elif os_type == "linux":
-        env = setup_linux(env)
-    
-    # Common setup
-    env = setup_pnpm(env)
+        env = setup_linux(env, with_puppeteer=args.with_puppeteer)
     
-    # Repository
-    clone_or_validate_repo(env, args.repo, project_dir)
-    
-    # Install dependencies
-    install_dependencies(env, project_dir)
+    # Common setup: pnpm bootstrap and the repo clone are independent,
+    # so run them concurrently
+    env = prepare_project(env, args.repo, project_dir, legacy_pnpm=args.legacy_pnpm)
     
-    # Render video (unless skipped)
+    # Install dependencies, then render unless skipped; the combined
+    # path drives both steps from a single pnpm process
     if not args.no_render:
-        render_video(env, project_dir)
-    else:
-        print_warning("Video rendering skipped (--no-render)")
-    
+        # Next steps and the completion banner go out up front: on
+        # POSIX the render execs over this interpreter, so nothing can
+        # print afterwards
+        print_next_steps(project_dir)
+        print("\n" + "="*60)
+        print_success("SETUP COMPLETE! Starting render...")
+        print("="*60 + "\n")
+        install_and_render(env, project_dir)
+        return 0
+
+    install_dependencies(env, project_dir)
+    print_warning("Video rendering skipped (--no-render)")
+
     # Print next steps
     print_next_steps(project_dir)
-    
+
     print("\n" + "="*60)
     print_success("SETUP COMPLETE!")
     print("="*60 + "\n")
-    
+
     return 0
 
 